@@ -299,7 +299,10 @@ def true_anomaly_to_time_since_periapsis(a, e, nu_deg, mu=mu_Sun):
 
 #Returns: list of (x,y,z) tuples in SHRF frame (meters)
 
-def generate_ellipse_timed_points_shrf(a, e, i_deg=0.0, raan_deg=0.0, argp_deg=0.0,start_nu_deg=0.0, mu = mu_Sun, delta_nu_deg=None,num_points=None, epoch=None):
+#If `return_nus=True`, the sampled true-anomaly grid (degrees) is returned as a
+#fourth element so callers can derive anomalies without reconstructing nu from
+#the positions.
+def generate_ellipse_timed_points_shrf(a, e, i_deg=0.0, raan_deg=0.0, argp_deg=0.0,start_nu_deg=0.0, mu = mu_Sun, delta_nu_deg=None,num_points=None, epoch=None, return_nus=False):
     if (e >= 1.0) or (e < 0.0):
         raise ValueError("Only elliptical orbits (e < 1) are supported.")
     start = start_nu_deg % 360.0
@@ -323,6 +326,8 @@ def generate_ellipse_timed_points_shrf(a, e, i_deg=0.0, raan_deg=0.0, argp_deg=0
         else:
             times = [round((float(epoch) + t), 1) for t in times_rel]
 
+        if return_nus:
+            return positions, velocities, times, [float(nu) for nu in nus]
         return positions, velocities, times
     elif num_points is not None:
         if num_points <= 0:
@@ -343,8 +348,10 @@ def generate_ellipse_timed_points_shrf(a, e, i_deg=0.0, raan_deg=0.0, argp_deg=0
     else:
         times = [round((float(epoch) + t), 1) for t in times_rel]
 
+    if return_nus:
+        return positions, velocities, times, [float(nu) for nu in nus]
     return positions, velocities, times
-    
+
 
 
 # Tsunami amplitude estimate
@@ -857,30 +864,25 @@ def compute_radii_from_energy(E_blast_j: float, thresholds_psi=(2.0, 5.0, 10.0,
     return W, radii
 
 
+#(fatality rate, injury rate) per overpressure threshold (see cheatsheet below)
+DAMAGE_RATES_BY_PSI = {
+    2.0: (0.001, 0.5),
+    5.0: (0.07, 0.6),
+    10.0: (0.3, 0.5),
+    20.0: (0.7, 0.3),
+}
+
 #feed this function energy in joules and eta (depends on terrain type)
-#returns a list of tuples (psi, radius in meters) and seismic magnitude
+#returns a list of tuples (psi, radius in meters, fatality rate, injury rate) and seismic magnitude
 def damage_coefficients_radii(kinetic_energy_joules, eta):
     blast_frac=0.3
     Wkg, radii = compute_radii_from_energy(kinetic_energy_joules*blast_frac)
-    radius_pressures = []
-    for psi,r in radii.items():
-        if r is None:
-            radius_pressures.append((psi, None))
-        else:
-            radius_pressures.append((psi, r))
-    
-    #creates a list of tuples (radius in meters, fatality rate, injury rate)
-    coefficients_per_radius = []
-    for r in radius_pressures:
-        if r[0] == 2:
-            coefficients_per_radius.append((r[1], 0.001, 0.5))
-        elif r[0] == 5:
-            coefficients_per_radius.append((r[1], 0.07, 0.6))  
-        elif r[0] == 10:
-            coefficients_per_radius.append((r[1], 0.3, 0.5))
-        elif r[0] == 20:
-            coefficients_per_radius.append((r[1], 0.7, 0.3))
-    #returns a list of tuples (radius in meters, fatality rate, injury rate) and seismic magnitude
+
+    #one dict lookup per threshold instead of an if/elif ladder on float equality
+    coefficients_per_radius = [
+        (psi, r) + DAMAGE_RATES_BY_PSI[psi]
+        for psi, r in radii.items() if psi in DAMAGE_RATES_BY_PSI
+    ]
     return coefficients_per_radius,get_seismic_equivalent(kinetic_energy_joules, eta)
 
 #CHEATSHEET:
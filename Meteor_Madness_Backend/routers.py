@@ -1,6 +1,7 @@
 from datetime import datetime, timezone
 from fastapi import FastAPI, HTTPException, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import random
 import asyncio
 from typing import Dict, Any, List
@@ -132,12 +133,14 @@ async def simulate(obj_id: str, preview: str = "true"):
     if is_preview:
         orbit_payload = sim.static_orbit(raw)
         if isinstance(orbit_payload, dict):
-            return {
+            # ORJSONResponse serializes ndarrays/tuples directly (skips
+            # jsonable_encoder walking 1000 points)
+            return ORJSONResponse({
                 "asteroid_trajectory": orbit_payload.get("points", []),
                 "orbit_meta": orbit_payload.get("orbit_meta", {})
-            }
+            })
         # backward fallback if function returned legacy list
-        return {"asteroid_trajectory": orbit_payload}
+        return ORJSONResponse({"asteroid_trajectory": orbit_payload})
 
     job_id = random.randint(10000, 99999)
     async_results[str(job_id)] = {"done": False, "data": None}
@@ -173,13 +176,15 @@ def get_report(job_id: str, response: Response):
             del async_results[int(job_id)]
         except Exception:
             pass
-    return data
+    # full_sim responses carry ndarrays; orjson's numpy path serializes them
+    # straight to bytes without building intermediate Python floats
+    return ORJSONResponse(data)
 
 ####POST REQUESTS####
 
 @app.post("/simulate_impact")
-def impact_sim(data: dict):
-    result = sim.impact(data)
+async def impact_sim(data: dict):
+    result = await sim.impact(data)
     return result
     
 